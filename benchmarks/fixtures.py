@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# Deterministic synthetic fixtures for the benchmark suite.
+#
+# Every generator takes a seed and produces the same output for the same
+# arguments, so timings from different runs and machines are comparable.
+# Generated fixtures are cached on disk under a name derived from their
+# parameters and reused until the parameters change.
+
+import os
+import random
+import shutil
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+
+DEFAULT_SEED = 20250626
+
+# Stand-in for the MySQL external_system_requests table
+REQUESTS_TABLE = "external_system_requests"
+REQUESTS_TARGET_TABLE = "external_system_requests_old"
+REQUEST_SYSTEMS = ["EPIC", "WORKDAY", "AD", "KRONOS", "SERVICENOW", "OKTA"]
+REQUEST_TYPES = ["CREATE", "UPDATE", "DISABLE", "ENABLE", "DELETE"]
+REQUEST_STATUSES = ["PENDING", "SENT", "COMPLETE", "FAILED"]
+
+
+def _marker_path(path):
+    return path + ".complete"
+
+
+def _is_built(path):
+    return os.path.exists(path) and os.path.exists(_marker_path(path))
+
+
+def _mark_built(path, content=""):
+    with open(_marker_path(path), "w") as f:
+        f.write(content)
+
+
+def build_file_tree(base_dir, file_count=20000, depth=4, fanout=6, max_file_size=64 * 1024,
+                    seed=DEFAULT_SEED):
+    """
+    Create a synthetic directory tree for utility/file_size.py.
+
+    Files are spread over a fanout**depth directory grid with sizes drawn
+    from a skewed distribution (many small files, a few large ones), which
+    is roughly what home and share directories look like.
+
+    Returns:
+        (root path, total bytes, file count)
+    """
+    root = os.path.join(base_dir, f"tree_f{file_count}_d{depth}_n{fanout}_m{max_file_size}_s{seed}")
+    if _is_built(root):
+        with open(_marker_path(root)) as f:
+            return root, int(f.read()), file_count
+
+    shutil.rmtree(root, ignore_errors=True)
+    rng = random.Random(seed)
+
+    dirs = [root]
+    for _ in range(depth):
+        dirs = [os.path.join(d, f"dir{i:02d}") for d in dirs for i in range(fanout)]
+    for d in dirs:
+        os.makedirs(d, exist_ok=True)
+
+    total_size = 0
+    chunk = b"\0" * max_file_size
+    for i in range(file_count):
+        size = min(int(rng.paretovariate(1.2) * 512), max_file_size)
+        with open(os.path.join(rng.choice(dirs), f"file{i:07d}.bin"), "wb") as f:
+            f.write(chunk[:size])
+        total_size += size
+
+    _mark_built(root, str(total_size))
+    return root, total_size, file_count
+
+
+def _request_rows(row_count, first_id, seed):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(row_count):
+        created = start + timedelta(seconds=i * 7)
+        yield (
+            first_id + i,
+            rng.choice(REQUEST_SYSTEMS),
+            rng.choice(REQUEST_TYPES),
+            rng.choice(REQUEST_STATUSES),
+            f"user{rng.randrange(250000):06d}",
+            "x" * rng.randrange(32, 256),
+            created.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+
+def build_requests_db(base_dir, row_count=2000000, first_id=100000001, seed=DEFAULT_SEED):
+    """
+    Create a SQLite database standing in for the MySQL source of the
+    external_system_requests data move.
+
+    IDs start at first_id so the same "ID > ... AND ID <= ..." range query
+    used against MySQL selects every generated row.
+
+    Returns:
+        Path to the SQLite file
+    """
+    path = os.path.join(base_dir, f"requests_r{row_count}_s{seed}.db")
+    if _is_built(path):
+        return path
+
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(f"""
+            CREATE TABLE {REQUESTS_TABLE} (
+                ID INTEGER PRIMARY KEY,
+                system_name TEXT NOT NULL,
+                request_type TEXT NOT NULL,
+                status TEXT NOT NULL,
+                account_name TEXT NOT NULL,
+                payload TEXT,
+                created_at TEXT NOT NULL
+            )
+        """)
+        conn.executemany(f"INSERT INTO {REQUESTS_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         _request_rows(row_count, first_id, seed))
+        conn.commit()
+    finally:
+        conn.close()
+
+    _mark_built(path)
+    return path
+
+
+def build_inventory_db(base_dir, table_count=200, total_rows=1000000, seed=DEFAULT_SEED):
+    """
+    Create a SQLite database standing in for the SQL Server catalogue read
+    by MSSQLTableAnalyzer.get_table_counts.
+
+    Row counts follow a long-tail distribution across tables. ANALYZE is
+    run afterwards so sqlite_stat1 holds per-table row counts, the SQLite
+    counterpart of sys.partitions.rows.
+
+    Returns:
+        Path to the SQLite file
+    """
+    path = os.path.join(base_dir, f"inventory_t{table_count}_r{total_rows}_s{seed}.db")
+    if _is_built(path):
+        return path
+
+    if os.path.exists(path):
+        os.remove(path)
+    rng = random.Random(seed)
+    weights = [rng.paretovariate(1.1) for _ in range(table_count)]
+    scale = total_rows / sum(weights)
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        for i, weight in enumerate(weights):
+            table = f"table_{i:04d}"
+            conn.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, name TEXT, value REAL)")
+            rows = max(1, int(weight * scale))
+            conn.executemany(f"INSERT INTO {table} (name, value) VALUES (?, ?)",
+                             ((f"row{j}", rng.random()) for j in range(rows)))
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+
+    _mark_built(path)
+    return path
+
+
+def build_guid_set(count=100000, seed=DEFAULT_SEED):
+    """
+    Generate a deterministic list of GUID strings for the LDAP filter helpers.
+
+    Returns:
+        List of GUIDs formatted like '12345678-1234-1234-1234-123456789abc'
+    """
+    rng = random.Random(seed)
+    return [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(count)]
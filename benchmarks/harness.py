@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Timing, baseline storage and regression checks for the benchmark suite.
+
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+
+def time_benchmark(func, setup=None, warmup=1, repeat=5, min_time=0.1):
+    """
+    Time func over repeated runs.
+
+    Calls that finish faster than min_time are looped so each sample lasts
+    at least min_time; otherwise millisecond timings are mostly noise.
+    Benchmarks with a setup step always run one call per sample, since the
+    setup has to come before every call.
+
+    Args:
+        func: Zero-argument callable being measured
+        setup: Optional zero-argument callable run untimed before every call
+        warmup: Number of untimed calls made first
+        repeat: Number of timed samples
+        min_time: Minimum seconds per sample
+
+    Returns:
+        Dict with the per-call samples and their min/median/mean/stdev in seconds
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        func()
+
+    number = 1
+    if setup is None:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if elapsed < min_time:
+            number = math.ceil(min_time / max(elapsed, 1e-9))
+
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "number": number,
+        "samples": samples,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "warmup": warmup,
+        "repeat": repeat,
+    }
+
+
+def environment_info():
+    """Describe the machine the results came from"""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_results(file_path, results, params):
+    """Write benchmark results (and the fixture parameters used) as JSON"""
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "environment": environment_info(),
+        "params": params,
+        "results": results,
+    }
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+    return file_path
+
+
+def load_results(file_path):
+    """Load a results document written by save_results, or None if missing"""
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(results, baseline, threshold=0.10, stat="median"):
+    """
+    Compare results against a baseline document.
+
+    A benchmark regresses when its stat is more than threshold (a fraction,
+    0.10 = 10%) slower than the baseline's.
+
+    Returns:
+        List of dicts with name, baseline, current, change and regressed
+    """
+    comparisons = []
+    for name, result in sorted(results.items()):
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        change = (result[stat] - base[stat]) / base[stat] if base[stat] else 0.0
+        comparisons.append({
+            "name": name,
+            "baseline": base[stat],
+            "current": result[stat],
+            "change": change,
+            "regressed": change > threshold,
+        })
+    return comparisons
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+# Benchmark suite for the toolkit subsystems.
+#
+# Runs every subsystem against deterministic synthetic fixtures instead of
+# the live servers the example scripts in tests/ need:
+#   file_size.*   - get_directory_size over a generated file tree
+#   data_move.*   - read_requests/write_requests, SQLite standing in for MySQL/MSSQL
+#   inventory.*   - MSSQLTableAnalyzer.get_table_counts, SQLite standing in for SQL Server
+#   ldap.*        - the GUID filter helpers over a bulk GUID set
+#
+# Usage (from the repository root):
+#   python -m benchmarks.run_benchmarks --update-baseline
+#   python -m benchmarks.run_benchmarks --threshold 0.15
+#   python -m benchmarks.run_benchmarks --only file_size ldap --scale 0.1
+
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import uuid
+
+from benchmarks import fixtures
+from benchmarks.harness import compare_results, load_results, save_results, time_benchmark
+
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures_cache")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "baseline.json")
+
+# Fixture sizes at --scale 1.0
+FILE_TREE_FILES = 20000
+REQUEST_ROWS = 2000000
+INVENTORY_TABLES = 200
+INVENTORY_ROWS = 1000000
+GUID_COUNT = 100000
+
+# Same shape as the row-count query in tests/Mobius.py, against sqlite_stat1
+INVENTORY_QUERY = """
+    SELECT
+        'main' AS [Schema],
+        s.tbl AS [Table_Name],
+        MAX(CAST(s.stat AS INTEGER)) AS [Row_Count]
+    FROM
+        sqlite_stat1 s
+        INNER JOIN sqlite_master m ON m.name = s.tbl
+    WHERE
+        m.type = 'table'
+    GROUP BY
+        s.tbl
+    ORDER BY
+        [Row_Count] DESC, [Table_Name]
+"""
+
+
+def _quiet(func):
+    """Wrap func so the status lines it prints don't distort the timings"""
+    def wrapper():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return wrapper
+
+
+def bench_file_size(params, stack):
+    from utility.file_size import get_directory_size
+
+    root, total_size, _ = fixtures.build_file_tree(params["fixture_dir"], file_count=params["file_count"],
+                                                   seed=params["seed"])
+
+    def scan():
+        size = get_directory_size(root)
+        assert size == total_size, f"expected {total_size} bytes, got {size}"
+
+    return {"file_size.get_directory_size": (_quiet(scan), None)}
+
+
+def bench_data_move(params, stack):
+    from sqlalchemy import create_engine
+
+    from tests.ExternalSystemRequestsDataMove import READ_QUERY, read_requests, write_requests
+
+    source_path = fixtures.build_requests_db(params["fixture_dir"], row_count=params["request_rows"],
+                                             seed=params["seed"])
+    target_path = os.path.join(params["fixture_dir"], "data_move_target.db")
+    loaded = {}
+
+    def read():
+        with contextlib.closing(sqlite3.connect(source_path)) as conn:
+            loaded["df"] = read_requests(conn, READ_QUERY)
+
+    def reset_target():
+        if "df" not in loaded:
+            read()
+        if os.path.exists(target_path):
+            os.remove(target_path)
+
+    def write():
+        engine = create_engine(f"sqlite:///{target_path}")
+        try:
+            write_requests(loaded["df"], engine, table_name=fixtures.REQUESTS_TARGET_TABLE)
+        finally:
+            engine.dispose()
+
+    return {
+        "data_move.read_sql": (read, None),
+        "data_move.to_sql": (write, reset_target),
+    }
+
+
+def bench_inventory(params, stack):
+    from tests.Mobius import MSSQLTableAnalyzer
+
+    path = fixtures.build_inventory_db(params["fixture_dir"], table_count=params["inventory_tables"],
+                                       total_rows=params["inventory_rows"], seed=params["seed"])
+
+    # Drive the real method with a SQLite connection and the SQLite query
+    analyzer = MSSQLTableAnalyzer(server="sqlite", database=os.path.basename(path))
+    analyzer.TABLE_COUNTS_QUERY = INVENTORY_QUERY
+    analyzer.connection = stack.enter_context(contextlib.closing(sqlite3.connect(path)))
+
+    def table_counts():
+        df = analyzer.get_table_counts()
+        assert df is not None and len(df) == params["inventory_tables"]
+
+    return {"inventory.get_table_counts": (_quiet(table_counts), None)}
+
+
+def bench_ldap(params, stack):
+    from tests.Ldap3 import guid_bytes_to_ldap_filter, guid_to_ldap_filter
+
+    guids = fixtures.build_guid_set(params["guid_count"], seed=params["seed"])
+    guid_bytes = [uuid.UUID(g).bytes_le for g in guids]
+
+    def from_strings():
+        for guid in guids:
+            guid_to_ldap_filter(guid)
+
+    def from_bytes():
+        for raw in guid_bytes:
+            guid_bytes_to_ldap_filter(raw)
+
+    return {
+        "ldap.guid_to_ldap_filter": (from_strings, None),
+        "ldap.guid_bytes_to_ldap_filter": (from_bytes, None),
+    }
+
+
+SUBSYSTEMS = {
+    "file_size": bench_file_size,
+    "data_move": bench_data_move,
+    "inventory": bench_inventory,
+    "ldap": bench_ldap,
+}
+
+
+def fixture_params(args):
+    """Fixture parameters for a run; baselines only compare when these match"""
+    return {
+        "seed": args.seed,
+        "file_count": max(1, int(FILE_TREE_FILES * args.scale)),
+        "request_rows": max(1, int(REQUEST_ROWS * args.scale)),
+        "inventory_tables": INVENTORY_TABLES,
+        "inventory_rows": max(INVENTORY_TABLES, int(INVENTORY_ROWS * args.scale)),
+        "guid_count": max(1, int(GUID_COUNT * args.scale)),
+    }
+
+
+def _non_negative_float(text):
+    value = float(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return value
+
+
+def _positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the toolkit benchmark suite")
+    parser.add_argument("--only", nargs="+", choices=sorted(SUBSYSTEMS), default=sorted(SUBSYSTEMS),
+                        help="subsystems to run (default: all)")
+    parser.add_argument("--scale", type=float, default=1.0, help="fixture size multiplier (default: 1.0)")
+    parser.add_argument("--seed", type=int, default=fixtures.DEFAULT_SEED, help="fixture random seed")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per benchmark (default: 1)")
+    parser.add_argument("--repeat", type=_positive_int, default=5, help="timed runs per benchmark (default: 5)")
+    parser.add_argument("--fixture-dir", default=DEFAULT_FIXTURE_DIR, help="where generated fixtures are cached")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--output", help="also write this run's results to this JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="record this run as the baseline")
+    parser.add_argument("--min-time", type=_non_negative_float, default=0.1,
+                        help="minimum seconds per timed sample; fast calls are looped (default: 0.1)")
+    parser.add_argument("--threshold", type=_non_negative_float, default=0.10,
+                        help="slowdown fraction that counts as a regression (default: 0.10)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    params = fixture_params(args)
+    os.makedirs(args.fixture_dir, exist_ok=True)
+    build_params = dict(params, fixture_dir=args.fixture_dir)
+
+    results = {}
+    for subsystem in args.only:
+        print(f"Preparing {subsystem} fixtures...")
+        with contextlib.ExitStack() as stack:
+            try:
+                benchmarks = SUBSYSTEMS[subsystem](build_params, stack)
+            except ImportError as e:
+                # Optional drivers (pandas, sqlalchemy, pyodbc, ...) may be missing
+                print(f"  skipped: {e}")
+                continue
+            for name, (func, setup) in benchmarks.items():
+                result = time_benchmark(func, setup=setup, warmup=args.warmup, repeat=args.repeat,
+                                        min_time=args.min_time)
+                results[name] = result
+                print(f"  {name:40} median {result['median']:.4f}s  "
+                      f"min {result['min']:.4f}s  stdev {result['stdev']:.4f}s")
+
+    if args.output:
+        save_results(args.output, results, params)
+        print(f"Results written to: {args.output}")
+
+    if args.update_baseline:
+        # Keep entries for subsystems not run this time if they are comparable
+        previous = load_results(args.baseline)
+        if previous is not None and previous.get("params") == params:
+            results = dict(previous["results"], **results)
+        save_results(args.baseline, results, params)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    if baseline.get("params") != params:
+        print("Baseline was recorded with different fixture parameters; skipping comparison")
+        return 0
+
+    regressions = 0
+    print(f"\nComparison against baseline (threshold {args.threshold:.0%}):")
+    for row in compare_results(results, baseline, threshold=args.threshold):
+        flag = "REGRESSION" if row["regressed"] else "ok"
+        regressions += row["regressed"]
+        print(f"  {row['name']:40} {row['baseline']:.4f}s -> {row['current']:.4f}s "
+              f"({row['change']:+.1%}) {flag}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import os
+import sys
+import time
 import pandas as pd
 from sqlalchemy import create_engine
 import urllib
 
+# Make the repository root importable when this file is run directly
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility import metrics
+
 # =================CONFIGURATION=================
 # MySQL Details
 MYSQL_USER = 'idmread'
@@ -22,33 +31,92 @@ MSSQL_DRIVER = 'ODBC Driver 17 for SQL Server'
 
 MYSQL_TABLE_NAME   = 'external_system_requests'
 MSSQL_TABLE_NAME = 'external_system_requests_old'
+
+# Rows handed to each to_sql call; progress metrics are updated per batch
+WRITE_BATCH_ROWS = 50000
+# Rows sampled to estimate the in-memory size of what was read
+BYTES_SAMPLE_ROWS = 1000
 # ===============================================
 
-try:
-    # 1. Create MySQL Engine
-    mysql_conn_str = f"mysql+mysqlconnector://{MYSQL_USER}:{MYSQL_PASS}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
-    mysql_engine = create_engine(mysql_conn_str)
+READ_QUERY = f"SELECT * FROM {MYSQL_TABLE_NAME} WHERE ID > 100000000 AND ID <= 200000000"
 
-    # 2. Create MSSQL Engine
-    # SQLAlchemy requires a specific URL format for PyODBC
-    params = urllib.parse.quote_plus(
-        f"DRIVER={{{MSSQL_DRIVER}}};SERVER={MSSQL_SERVER};DATABASE={MSSQL_DB};UID={MSSQL_USER};PWD={MSSQL_PASS}"
-    )
-    mssql_conn_str = f"mssql+pyodbc:///?odbc_connect={params}"
-    mssql_engine = create_engine(mssql_conn_str)
 
-    print("Reading from MySQL...")
-    # Read data
-    df = pd.read_sql(f"SELECT * FROM {MYSQL_TABLE_NAME} WHERE ID > 100000000 AND ID <= 200000000", mysql_engine)
+def read_requests(source_con, query=READ_QUERY):
+    """Read the requests to move, recording read time and throughput"""
+    start = time.perf_counter()
+    df = pd.read_sql(query, source_con)
+    elapsed = time.perf_counter() - start
+    metrics.observe("data_move_read", elapsed)
+    metrics.record_throughput("data_move_read", len(df), elapsed, "rows")
+    # Estimate bytes from a sample; a deep memory_usage over every row would dominate the run
+    sample = df.head(BYTES_SAMPLE_ROWS)
+    if len(sample):
+        row_bytes = sample.memory_usage(deep=True).sum() / len(sample)
+        metrics.record_throughput("data_move_read", int(row_bytes * len(df)), elapsed, "bytes")
+    return df
 
-    print(f"Read {len(df)} rows. Writing to MSSQL...")
 
-    # Write data
+def write_requests(df, target_engine, table_name=MSSQL_TABLE_NAME, batch_rows=WRITE_BATCH_ROWS):
+    """
+    Append df to the target table, recording per-batch progress.
+
+    Every batch is written inside one transaction, so the move still
+    commits all rows or none and a rerun after a failure can't duplicate
+    rows that were appended before it.
+
+    Args:
+        df: Rows to write
+        target_engine: SQLAlchemy engine for the target database
+        table_name: Target table (created if missing, even when df is empty)
+        batch_rows: Rows handed to each to_sql call
+    """
     # if_exists options: 'fail', 'replace', 'append'
     # chunksize: writes rows in batches (good for memory)
-    df.to_sql(MSSQL_TABLE_NAME, mssql_engine, if_exists='append', index=False, chunksize=1000)
+    start = time.perf_counter()
+    with target_engine.begin() as conn:
+        # At least one call, so an empty frame still creates the table
+        for offset in range(0, max(len(df), 1), batch_rows):
+            metrics.set_gauge("data_move_write_pending_rows", len(df) - offset)
+            batch = df.iloc[offset:offset + batch_rows]
+            with metrics.timer("data_move_write_batch"):
+                batch.to_sql(table_name, conn, if_exists='append', index=False, chunksize=1000)
+            metrics.inc("data_move_write_rows_total", len(batch))
+    metrics.set_gauge("data_move_write_pending_rows", 0)
+    elapsed = time.perf_counter() - start
+    metrics.observe("data_move_write", elapsed)
+    if elapsed > 0:
+        metrics.set_gauge("data_move_write_rows_per_second", len(df) / elapsed)
+
+
+if __name__ == "__main__":
+    try:
+        with metrics.profile_run("external_system_requests_move"):
+            # 1. Create MySQL Engine
+            mysql_conn_str = f"mysql+mysqlconnector://{MYSQL_USER}:{MYSQL_PASS}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
+            mysql_engine = create_engine(mysql_conn_str)
+
+            # 2. Create MSSQL Engine
+            # SQLAlchemy requires a specific URL format for PyODBC
+            params = urllib.parse.quote_plus(
+                f"DRIVER={{{MSSQL_DRIVER}}};SERVER={MSSQL_SERVER};DATABASE={MSSQL_DB};UID={MSSQL_USER};PWD={MSSQL_PASS}"
+            )
+            mssql_conn_str = f"mssql+pyodbc:///?odbc_connect={params}"
+            mssql_engine = create_engine(mssql_conn_str)
+
+            print("Reading from MySQL...")
+            # Read data
+            df = read_requests(mysql_engine)
+
+            print(f"Read {len(df)} rows. Writing to MSSQL...")
+
+            # Write data
+            write_requests(df, mssql_engine)
+
+            print("Transfer Complete.")
 
-    print("Transfer Complete.")
+    except Exception as e:
+        metrics.inc("data_move_errors_total")
+        print(f"Error: {e}")
 
-except Exception as e:
-    print(f"Error: {e}")
\ No newline at end of file
+    finally:
+        metrics.export_run("external_system_requests_move")
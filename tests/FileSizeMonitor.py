@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+# Self-contained checks for utility/file_size_monitor.py.
+#
+# Everything runs against temporary directories, so unlike the other
+# scripts here no server is needed. Linux only (inotify).
+#
+# Usage (from the repository root):
+#   python -m tests.FileSizeMonitor
+
+import contextlib
+import errno
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+# Make the repository root importable when this file is run directly
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility import file_size_monitor as fsm
+from utility.file_size import get_directory_size
+
+
+def write_file(path, size):
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+
+def real_size(path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return get_directory_size(path)
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll condition until it holds; events arrive asynchronously"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return condition()
+
+
+def assert_in_sync(monitor, root, label):
+    synced = wait_for(lambda: monitor.get_total()["size"] == real_size(root))
+    assert synced, f"{label}: monitor has {monitor.get_total()['size']}, disk has {real_size(root)}"
+    assert monitor._thread.is_alive(), f"{label}: monitor thread died"
+    print(f"✅ {label}")
+
+
+@contextlib.contextmanager
+def running_monitor(**kwargs):
+    root = tempfile.mkdtemp(prefix="fsm_")
+    monitor = fsm.DirectorySizeMonitor(root, **kwargs)
+    try:
+        yield root, monitor
+    finally:
+        monitor.stop()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def check_incremental_totals():
+    with running_monitor() as (root, monitor):
+        os.makedirs(os.path.join(root, "a", "b"))
+        write_file(os.path.join(root, "a", "b", "f1"), 100)
+        monitor.start()
+        assert monitor.mode == fsm.MODE_INOTIFY
+        assert_in_sync(monitor, root, "initial scan")
+
+        os.makedirs(os.path.join(root, "c", "d"))
+        write_file(os.path.join(root, "c", "d", "g"), 2000)
+        assert_in_sync(monitor, root, "create directories and file")
+
+        with open(os.path.join(root, "a", "b", "f1"), "ab") as f:
+            f.write(b"y" * 50)
+        assert_in_sync(monitor, root, "append to file")
+
+        os.rename(os.path.join(root, "a", "b", "f1"), os.path.join(root, "a", "f2"))
+        assert_in_sync(monitor, root, "rename file")
+
+        os.rename(os.path.join(root, "c"), os.path.join(root, "a", "c"))
+        assert_in_sync(monitor, root, "rename directory")
+        assert monitor.get_total(os.path.join(root, "a", "c"))["size"] == 2000
+
+        os.remove(os.path.join(root, "a", "f2"))
+        assert_in_sync(monitor, root, "delete file")
+
+        shutil.rmtree(os.path.join(root, "a", "c"))
+        assert_in_sync(monitor, root, "delete directory tree")
+        assert monitor.get_total(os.path.join(root, "a", "c")) is None
+
+        outside = tempfile.mkdtemp(prefix="fsm_outside_")
+        os.makedirs(os.path.join(outside, "x", "y"))
+        write_file(os.path.join(outside, "x", "y", "h"), 512)
+        shutil.move(os.path.join(outside, "x"), os.path.join(root, "x"))
+        shutil.rmtree(outside)
+        assert_in_sync(monitor, root, "move a tree in from outside")
+        write_file(os.path.join(root, "x", "y", "h2"), 64)
+        assert_in_sync(monitor, root, "write inside the moved-in tree")
+
+
+def check_queries_during_subtree_scan():
+    original = fsm.DirectorySizeMonitor._scan_tree
+    scanning = []
+
+    def slow_scan_tree(self, tree, dir_path):
+        if tree.root != self.root:
+            scanning.append(dir_path)
+            time.sleep(1.0)
+        return original(self, tree, dir_path)
+
+    fsm.DirectorySizeMonitor._scan_tree = slow_scan_tree
+    try:
+        with running_monitor() as (root, monitor):
+            monitor.start()
+            os.makedirs(os.path.join(root, "slow", "tree"))
+            assert wait_for(lambda: scanning), "subtree scan did not start"
+            start = time.perf_counter()
+            monitor.get_total()
+            assert time.perf_counter() - start < 0.5, "query blocked on a subtree scan"
+            assert_in_sync(monitor, root, "queries answered while a new subtree is scanned")
+    finally:
+        fsm.DirectorySizeMonitor._scan_tree = original
+
+
+def check_vanishing_directories():
+    with running_monitor() as (root, monitor):
+        monitor.start()
+        for i in range(300):
+            path = os.path.join(root, f"t{i}")
+            os.mkdir(path)
+            os.mkdir(os.path.join(path, "sub"))
+            shutil.rmtree(path)
+        write_file(os.path.join(root, "after"), 123)
+        assert_in_sync(monitor, root, "directories removed while being watched")
+        assert monitor.mode == fsm.MODE_INOTIFY
+
+
+def check_unwatchable_directory():
+    original = fsm.Inotify.add_watch
+
+    def add_watch(self, path, mask=fsm.WATCH_MASK):
+        if os.path.basename(path) == "locked":
+            raise OSError(errno.EACCES, "Permission denied", path)
+        return original(self, path, mask)
+
+    fsm.Inotify.add_watch = add_watch
+    try:
+        with running_monitor() as (root, monitor):
+            os.makedirs(os.path.join(root, "locked"))
+            write_file(os.path.join(root, "open"), 10)
+            monitor.start()
+            assert monitor.mode == fsm.MODE_INOTIFY, "one unwatchable directory must not force rescans"
+            assert monitor.get_total()["size"] == 10
+            print("✅ unwatchable directory is skipped")
+    finally:
+        fsm.Inotify.add_watch = original
+
+
+def check_watch_limit_fallback():
+    original = fsm.Inotify.add_watch
+
+    def add_watch(self, path, mask=fsm.WATCH_MASK):
+        if path.endswith("deep"):
+            raise fsm.WatchLimitExceeded(errno.ENOSPC, "inotify watch limit reached", path)
+        return original(self, path, mask)
+
+    fsm.Inotify.add_watch = add_watch
+    try:
+        with running_monitor(rescan_interval=0.2) as (root, monitor):
+            os.makedirs(os.path.join(root, "deep", "er"))
+            write_file(os.path.join(root, "deep", "er", "f"), 77)
+            with contextlib.redirect_stdout(io.StringIO()):
+                monitor.start()
+            assert monitor.mode == fsm.MODE_RESCAN
+            assert monitor.get_total()["size"] == 77, "the scan must finish without watches"
+            write_file(os.path.join(root, "new"), 3)
+            assert_in_sync(monitor, root, "watch limit falls back to rescans")
+    finally:
+        fsm.Inotify.add_watch = original
+
+
+def check_thresholds():
+    alerts = []
+
+    def failing_callback(total, limit):
+        raise RuntimeError("callback bug")
+
+    with running_monitor() as (root, monitor):
+        monitor.add_threshold(1000, lambda total, limit: alerts.append(total["size"]))
+        monitor.add_threshold(1000, failing_callback)
+        try:
+            monitor.add_threshold(1, failing_callback, path=tempfile.gettempdir())
+            raise AssertionError("threshold outside the root was accepted")
+        except ValueError:
+            pass
+        monitor.start()
+        big = os.path.join(root, "big")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            write_file(big, 2000)
+            assert wait_for(lambda: len(alerts) == 1), "threshold did not fire"
+            write_file(big, 10)
+            assert_in_sync(monitor, root, "drop below threshold")
+            assert len(alerts) == 1, "threshold fired while below the limit"
+            write_file(big, 3000)
+            assert wait_for(lambda: len(alerts) == 2), "threshold did not re-arm"
+        assert monitor._thread.is_alive(), "failing callback killed the monitor thread"
+        print("✅ threshold fires, re-arms and survives a failing callback")
+
+
+def check_root_removed():
+    with running_monitor(rescan_interval=0.2) as (root, monitor):
+        write_file(os.path.join(root, "f"), 10)
+        with contextlib.redirect_stdout(io.StringIO()):
+            monitor.start()
+            shutil.rmtree(root)
+            assert wait_for(lambda: monitor.mode == fsm.MODE_RESCAN), "root removal left inotify mode"
+            os.makedirs(root)
+            write_file(os.path.join(root, "g"), 42)
+            assert wait_for(lambda: monitor.get_total()["size"] == 42), "recreated root was not picked up"
+        print("✅ removed root switches to rescans and recovers")
+
+
+def check_query_api():
+    with running_monitor() as (root, monitor):
+        monitor.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            port = monitor.serve(0)
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/totals?depth=abc")
+            raise AssertionError("bad depth was accepted")
+        except urllib.error.HTTPError as e:
+            assert e.code == 400
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/totals?depth=2") as response:
+            assert response.status == 200
+        print("✅ query API rejects a bad depth with 400")
+
+
+if __name__ == "__main__":
+    print("🚀 File size monitor checks")
+    print("=" * 40)
+    check_incremental_totals()
+    check_queries_during_subtree_scan()
+    check_vanishing_directories()
+    check_unwatchable_directory()
+    check_watch_limit_fallback()
+    check_thresholds()
+    check_root_removed()
+    check_query_api()
+    print("\nAll checks passed.")
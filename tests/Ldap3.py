@@ -1,5 +1,13 @@
+import os
+import sys
 import uuid
 
+# Make the repository root importable when this file is run directly
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility import metrics
+
 def guid_to_ldap_filter(guid_string):
     """
     Convert a GUID string to LDAP filter format.
@@ -19,6 +27,8 @@ def guid_to_ldap_filter(guid_string):
     # Convert each byte to \XX format
     ldap_format = ''.join(f'\\{byte:02x}' for byte in guid_bytes)
 
+    metrics.inc("ldap_guid_filters_total", labels={"source": "string"})
+
     # Return as LDAP filter
     return f"(objectGUID={ldap_format})"
 
@@ -34,6 +44,7 @@ def guid_bytes_to_ldap_filter(guid_bytes):
         LDAP filter string for objectGUID attribute
     """
     ldap_format = ''.join(f'\\{byte:02x}' for byte in guid_bytes)
+    metrics.inc("ldap_guid_filters_total", labels={"source": "bytes"})
     return f"(objectGUID={ldap_format})"
 
 
@@ -54,4 +65,6 @@ if __name__ == "__main__":
     print(f"From bytes: {ldap_filter2}")
 
     # Verify they match
-    print(f"\nFilters match: {ldap_filter == ldap_filter2}")
\ No newline at end of file
+    print(f"\nFilters match: {ldap_filter == ldap_filter2}")
+
+    metrics.export_run("ldap_guid_filters")
\ No newline at end of file
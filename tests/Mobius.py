@@ -1,15 +1,43 @@
 # -*- coding: utf-8 -*-
 
 
-import pyodbc
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
+import os
+import sys
+import time
 import warnings
+
+# Make the repository root importable when this file is run directly
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility import metrics
+
 warnings.filterwarnings('ignore')
 
 class MSSQLTableAnalyzer:
+    # Query to get all user tables and their row counts
+    TABLE_COUNTS_QUERY = """
+                SELECT
+                    t.TABLE_SCHEMA as [Schema],
+            t.TABLE_NAME as [Table_Name],
+            p.rows as [Row_Count]
+                FROM
+                    INFORMATION_SCHEMA.TABLES t
+                    INNER JOIN
+                    sys.tables st ON st.name = t.TABLE_NAME
+                    INNER JOIN
+                    sys.partitions p ON st.object_id = p.object_id
+                WHERE
+                    t.TABLE_TYPE = 'BASE TABLE'
+                  AND p.index_id < 2
+                ORDER BY
+                    p.rows DESC, t.TABLE_SCHEMA, t.TABLE_NAME \
+                """
+
     def __init__(self, server, database, username=None, password=None, trusted_connection=True):
         """
         Initialize MSSQL connection
@@ -49,6 +77,9 @@ class MSSQLTableAnalyzer:
                 PWD={self.password};
                 """
 
+            # Imported here so the analyzer can be used without an ODBC driver installed
+            import pyodbc
+
             self.connection = pyodbc.connect(connection_string)
             print(f"✅ Successfully connected to {self.database} on {self.server}")
             return True
@@ -64,30 +95,18 @@ class MSSQLTableAnalyzer:
             return None
 
         try:
-            # Query to get all user tables and their row counts
-            query = """
-                    SELECT
-                        t.TABLE_SCHEMA as [Schema],
-                t.TABLE_NAME as [Table_Name],
-                p.rows as [Row_Count]
-                    FROM
-                        INFORMATION_SCHEMA.TABLES t
-                        INNER JOIN
-                        sys.tables st ON st.name = t.TABLE_NAME
-                        INNER JOIN
-                        sys.partitions p ON st.object_id = p.object_id
-                    WHERE
-                        t.TABLE_TYPE = 'BASE TABLE'
-                      AND p.index_id < 2
-                    ORDER BY
-                        p.rows DESC, t.TABLE_SCHEMA, t.TABLE_NAME \
-                    """
-
-            df = pd.read_sql_query(query, self.connection)
+            labels = {"database": self.database}
+            start = time.perf_counter()
+            df = pd.read_sql_query(self.TABLE_COUNTS_QUERY, self.connection)
+            elapsed = time.perf_counter() - start
+            metrics.observe("mssql_table_counts_query", elapsed, labels)
+            metrics.set_gauge("mssql_tables", len(df), labels)
+            metrics.set_gauge("mssql_table_rows", int(df['Row_Count'].sum()) if len(df) else 0, labels)
             print(f"📊 Found {len(df)} tables in database")
             return df
 
         except Exception as e:
+            metrics.inc("mssql_table_counts_errors_total", labels={"database": self.database})
             print(f"❌ Query failed: {str(e)}")
             return None
 
@@ -251,7 +270,10 @@ def main():
     )
 
     # Connect to database
-    if not analyzer.connect():
+    with metrics.timer("mssql_connect", {"database": DATABASE}):
+        connected = analyzer.connect()
+    if not connected:
+        metrics.export_run("mssql_table_analyzer")
         return
 
     try:
@@ -282,6 +304,7 @@ def main():
     finally:
         # Always close the connection
         analyzer.close_connection()
+        metrics.export_run("mssql_table_analyzer")
 
 if __name__ == "__main__":
     # Example usage
@@ -295,4 +318,5 @@ if __name__ == "__main__":
     #     analyzer.create_bar_chart(df)
     #     analyzer.close_connection()
 
-    main()
\ No newline at end of file
+    with metrics.profile_run("mssql_table_analyzer"):
+        main()
\ No newline at end of file
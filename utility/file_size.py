@@ -1,7 +1,15 @@
 import os
 import pathlib
+import sys
+import time
 from pathlib import Path
 
+# Make the repository root importable when this file is run directly
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility import metrics
+
 def get_file_size_methods(file_path):
     """Demonstrate different ways to get file size in Python"""
 
@@ -73,18 +81,36 @@ def get_directory_size(directory_path):
     """Get total size of all files in a directory"""
     total_size = 0
     file_count = 0
+    error_count = 0
+    stat_seconds = 0.0
+    # Directories os.walk has discovered but not yet visited
+    pending_dirs = 1
+    start = time.perf_counter()
+
+    def on_walk_error(error):
+        # os.walk drops a directory it can't list without visiting it
+        nonlocal pending_dirs
+        pending_dirs -= 1
+        metrics.set_gauge("file_size_walk_pending_dirs", pending_dirs)
 
     try:
-        for root, dirs, files in os.walk(directory_path):
+        for root, dirs, files in os.walk(directory_path, onerror=on_walk_error):
+            # Directory symlinks are listed in dirs but not followed
+            pending_dirs += sum(1 for d in dirs if not os.path.islink(os.path.join(root, d))) - 1
+            metrics.set_gauge("file_size_walk_pending_dirs", pending_dirs)
             for file in files:
                 file_path = os.path.join(root, file)
+                stat_start = time.perf_counter()
                 try:
                     size = os.path.getsize(file_path)
                     total_size += size
                     file_count += 1
                 except OSError:
                     # Skip files that can't be accessed
+                    error_count += 1
                     continue
+                finally:
+                    stat_seconds += time.perf_counter() - stat_start
 
         print(f"Directory: {directory_path}")
         print(f"Total files: {file_count}")
@@ -95,6 +121,15 @@ def get_directory_size(directory_path):
         print(f"Error accessing directory: {e}")
         return 0
 
+    finally:
+        elapsed = time.perf_counter() - start
+        metrics.observe("file_size_directory_scan", elapsed)
+        metrics.observe("file_size_stat_time", stat_seconds)
+        metrics.inc("file_size_stat_calls_total", file_count + error_count)
+        metrics.inc("file_size_stat_errors_total", error_count)
+        metrics.record_throughput("file_size_scan", file_count, elapsed, "files")
+        metrics.record_throughput("file_size_scan", total_size, elapsed, "bytes")
+
 def check_file_exists_and_size(file_path):
     """Check if file exists and get its size"""
     if os.path.exists(file_path):
@@ -171,7 +206,9 @@ if __name__ == "__main__":
     print("=" * 60)
 
     # Get current directory size
-    get_directory_size(".")
+    with metrics.profile_run("file_size"):
+        get_directory_size(".")
+    metrics.export_run("file_size")
 
     # Clean up
     os.remove(example_file)
\ No newline at end of file
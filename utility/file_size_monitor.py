@@ -0,0 +1,711 @@
+# -*- coding: utf-8 -*-
+
+# Live directory size monitor.
+#
+# Scans a tree once, then follows Linux inotify events (through ctypes, no
+# extra dependency) to keep per-directory size totals current in memory,
+# so capacity checks never have to rescan the whole tree the way
+# get_directory_size does. When inotify is unavailable or the watch limit
+# (fs.inotify.max_user_watches) is hit, the monitor falls back to periodic
+# full rescans.
+#
+# Usage:
+#   python utility/file_size_monitor.py /data --threshold 500GB --port 8765
+#   curl "http://127.0.0.1:8765/total?path=/data/projects"
+
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import json
+import os
+import select
+import stat
+import struct
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Make the repository root importable when this file is run directly
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utility import metrics
+from utility.file_size import format_file_size
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+              | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW)
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+MODE_INOTIFY = "inotify"
+MODE_RESCAN = "rescan"
+
+
+class WatchLimitExceeded(OSError):
+    """Raised when the kernel refuses another inotify watch or instance"""
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+
+
+class Inotify:
+    """Minimal ctypes binding for an inotify instance"""
+
+    def __init__(self):
+        if _libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        self.fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            if err == errno.EMFILE:
+                raise WatchLimitExceeded(err, "inotify instance limit reached")
+            raise OSError(err, os.strerror(err))
+
+    def add_watch(self, path, mask=WATCH_MASK):
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise WatchLimitExceeded(err, "inotify watch limit reached", path)
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def rm_watch(self, wd):
+        # Fails with EINVAL when the kernel already dropped the watch
+        _libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self):
+        """Return pending (wd, mask, cookie, name) events without blocking"""
+        try:
+            data = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            events.append((wd, mask, cookie, name))
+        return events
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class _SizeTree:
+    """Recursive byte and file totals for every directory under a root"""
+
+    def __init__(self, root):
+        self.root = root
+        self.files = {}      # dir -> {file name: size}
+        self.subdirs = {}    # dir -> set of child dir paths
+        self.totals = {}     # dir -> [recursive bytes, recursive file count]
+
+    def apply_delta(self, dir_path, size_delta, count_delta):
+        path = dir_path
+        while True:
+            totals = self.totals.get(path)
+            if totals is not None:
+                totals[0] += size_delta
+                totals[1] += count_delta
+            if path == self.root:
+                break
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+
+    def register_dir(self, dir_path):
+        if dir_path in self.totals:
+            return
+        self.files[dir_path] = {}
+        self.subdirs[dir_path] = set()
+        self.totals[dir_path] = [0, 0]
+        parent = os.path.dirname(dir_path)
+        if dir_path != self.root and parent in self.subdirs:
+            self.subdirs[parent].add(dir_path)
+
+    def set_file(self, dir_path, name, size):
+        """Record a file's current size, or remove it when size is None"""
+        files = self.files.get(dir_path)
+        if files is None:
+            return
+        old = files.get(name)
+        if size is None:
+            if old is not None:
+                del files[name]
+                self.apply_delta(dir_path, -old, -1)
+        elif old is None:
+            files[name] = size
+            self.apply_delta(dir_path, size, 1)
+        elif old != size:
+            files[name] = size
+            self.apply_delta(dir_path, size - old, 0)
+
+    def graft(self, subtree):
+        """
+        Attach a separately scanned subtree below its parent directory.
+
+        Returns False when the parent is no longer in this tree.
+        """
+        sub_root = subtree.root
+        parent = os.path.dirname(sub_root)
+        if sub_root not in subtree.totals or parent not in self.totals:
+            return False
+        self.files.update(subtree.files)
+        self.subdirs.update(subtree.subdirs)
+        self.totals.update(subtree.totals)
+        self.subdirs[parent].add(sub_root)
+        size, count = subtree.totals[sub_root]
+        self.apply_delta(parent, size, count)
+        return True
+
+    def remove_tree(self, dir_path):
+        """Drop dir_path and everything below it; returns the removed directories"""
+        if dir_path not in self.totals:
+            return []
+        size, count = self.totals[dir_path]
+        parent = os.path.dirname(dir_path)
+        if dir_path != self.root:
+            self.apply_delta(parent, -size, -count)
+            self.subdirs.get(parent, set()).discard(dir_path)
+
+        removed = []
+        stack = [dir_path]
+        while stack:
+            path = stack.pop()
+            stack.extend(self.subdirs.pop(path, ()))
+            self.files.pop(path, None)
+            self.totals.pop(path, None)
+            removed.append(path)
+        return removed
+
+
+class DirectorySizeMonitor:
+    """
+    Keep recursive size totals for every directory under a root.
+
+    File sizes follow os.path.getsize and directory symlinks are not
+    descended into, matching get_directory_size in utility/file_size.py.
+    """
+
+    def __init__(self, root_path, rescan_interval=300, use_inotify=True):
+        """
+        Args:
+            root_path: Directory to monitor
+            rescan_interval: Seconds between full rescans in fallback mode
+            use_inotify: Set to False to force periodic rescans
+        """
+        self.root = os.path.abspath(root_path)
+        self.rescan_interval = rescan_interval
+        self.use_inotify = use_inotify
+        self.mode = None
+        self.last_scan = None
+
+        # Guards _tree; scanning and event handling only run on the monitor thread
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._server = None
+        self._inotify = None
+        self._wd_to_path = {}
+        self._path_to_wd = {}
+        self._thresholds = []
+        self._fallback_reported = False
+        self._tree = _SizeTree(self.root)
+        self._tree.register_dir(self.root)
+
+    # ------------------------------------------------------------------
+    # Watches and scanning
+    # ------------------------------------------------------------------
+
+    def _start_inotify(self):
+        try:
+            self._inotify = Inotify()
+            self.mode = MODE_INOTIFY
+        except OSError as e:
+            self._disable_inotify(e)
+
+    def _disable_inotify(self, reason):
+        # Report once, not on every failed retry while the tree stays too big
+        if not self._fallback_reported:
+            self._fallback_reported = True
+            print(f"inotify unavailable ({reason}); falling back to rescans every {self.rescan_interval}s")
+            metrics.inc("file_size_monitor_fallbacks_total")
+        self._close_inotify()
+        self.mode = MODE_RESCAN
+
+    def _close_inotify(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._wd_to_path.clear()
+        self._path_to_wd.clear()
+
+    def _watch(self, dir_path):
+        """
+        Watch dir_path ahead of listing it.
+
+        Returns False when the directory can't be watched (it vanished or
+        is unreadable) and should be skipped. Hitting the watch limit
+        switches to rescan mode instead and the scan carries on unwatched.
+        """
+        if self._inotify is None:
+            return True
+        try:
+            wd = self._inotify.add_watch(dir_path)
+        except WatchLimitExceeded as e:
+            self._disable_inotify(e)
+            return True
+        except OSError:
+            metrics.inc("file_size_monitor_unwatchable_dirs_total")
+            return False
+        self._wd_to_path[wd] = dir_path
+        self._path_to_wd[dir_path] = wd
+        return True
+
+    def _remove_tree(self, tree, dir_path):
+        self._remove_watches(tree.remove_tree(dir_path))
+
+    def _remove_watches(self, paths):
+        for path in paths:
+            wd = self._path_to_wd.pop(path, None)
+            if wd is not None:
+                self._wd_to_path.pop(wd, None)
+                if self._inotify is not None:
+                    self._inotify.rm_watch(wd)
+
+    def _scan_tree(self, tree, dir_path):
+        """
+        Register and size everything under dir_path into tree.
+
+        Each directory is watched before it is listed, so entries created
+        while the scan runs are either listed or reported as events.
+        """
+        stack = [dir_path]
+        while stack:
+            path = stack.pop()
+            if not self._watch(path) and path != self.root:
+                continue
+            tree.register_dir(path)
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        tree.set_file(path, entry.name, entry.stat().st_size)
+                except OSError:
+                    # Skip files that can't be accessed
+                    continue
+
+    @staticmethod
+    def _current_size(file_path):
+        """Size of a regular file, or None if it is gone or not a file"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return st.st_size if stat.S_ISREG(st.st_mode) else None
+
+    def _full_scan(self, reason):
+        """Build a fresh tree without holding the lock, then swap it in"""
+        start = time.perf_counter()
+        old_watches = dict(self._wd_to_path)
+        self._wd_to_path.clear()
+        self._path_to_wd.clear()
+
+        tree = _SizeTree(self.root)
+        self._scan_tree(tree, self.root)
+        if self._inotify is not None:
+            if self.root not in self._path_to_wd:
+                self._disable_inotify("the monitored root can't be watched")
+            else:
+                # Drop watches on directories that are no longer in the tree
+                for wd in old_watches:
+                    if wd not in self._wd_to_path:
+                        self._inotify.rm_watch(wd)
+
+        with self._lock:
+            self._tree = tree
+            self.last_scan = time.time()
+        if self.mode == MODE_INOTIFY:
+            self._fallback_reported = False
+        total_size, file_count = tree.totals[self.root]
+        elapsed = time.perf_counter() - start
+        metrics.inc("file_size_monitor_scans_total", labels={"reason": reason})
+        metrics.observe("file_size_monitor_scan", elapsed)
+        metrics.record_throughput("file_size_monitor_scan", file_count, elapsed, "files")
+        print(f"Scanned {self.root} ({reason}): {file_count} files, "
+              f"{format_file_size(total_size)} in {elapsed:.2f}s")
+
+    def initial_scan(self):
+        """Take the initial scan and set up watches"""
+        if self.use_inotify:
+            self._start_inotify()
+        else:
+            self.mode = MODE_RESCAN
+        self._full_scan("initial")
+        self._update_gauges()
+        self._check_thresholds()
+
+    # ------------------------------------------------------------------
+    # Event loops
+    # ------------------------------------------------------------------
+
+    def _handle_events(self, events):
+        """
+        Apply a batch of events to the tree.
+
+        Events are handled on the monitor thread, the only writer, so the
+        lock is held just for each mutation; scanning a moved-in subtree or
+        stat-ing files happens outside it and queries never wait on disk.
+        """
+        dirty = {}
+        overflow = False
+        root_gone = False
+        tree = self._tree
+        for wd, mask, _cookie, name in events:
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                break
+
+            if mask & IN_IGNORED:
+                path = self._wd_to_path.pop(wd, None)
+                if path is not None and self._path_to_wd.get(path) == wd:
+                    del self._path_to_wd[path]
+                continue
+
+            dir_path = self._wd_to_path.get(wd)
+            if dir_path is None:
+                continue
+
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                if dir_path == self.root:
+                    root_gone = True
+                    break
+                continue
+
+            path = os.path.join(dir_path, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_DELETE | IN_MOVED_FROM):
+                    with self._lock:
+                        self._remove_tree(tree, path)
+                elif mask & (IN_CREATE | IN_MOVED_TO):
+                    subtree = _SizeTree(path)
+                    self._scan_tree(subtree, path)
+                    with self._lock:
+                        self._remove_tree(tree, path)
+                        grafted = tree.graft(subtree)
+                    if not grafted:
+                        self._remove_watches(subtree.totals)
+            else:
+                # Resolve every touched file once per batch by stat-ing
+                # it, so ordering within the batch doesn't matter
+                dirty[(dir_path, name)] = None
+
+        if root_gone:
+            with self._lock:
+                self._tree = _SizeTree(self.root)
+                self._tree.register_dir(self.root)
+        elif not overflow:
+            sizes = [(dir_path, name, self._current_size(os.path.join(dir_path, name)))
+                     for dir_path, name in dirty]
+            with self._lock:
+                for dir_path, name, size in sizes:
+                    tree.set_file(dir_path, name, size)
+
+        metrics.inc("file_size_monitor_events_total", len(events))
+        if root_gone:
+            # Nothing is left to watch; rescans pick the root up if it returns
+            self._disable_inotify("the monitored root was deleted or moved")
+        elif overflow:
+            # Events were dropped; only a rescan can recover the totals
+            metrics.inc("file_size_monitor_overflows_total")
+            self._full_scan("overflow")
+
+    def _run_inotify(self):
+        while not self._stop.is_set() and self._inotify is not None:
+            ready, _, _ = select.select([self._inotify.fd], [], [], 1.0)
+            if not ready:
+                continue
+            events = self._inotify.read_events()
+            if not events:
+                continue
+            self._handle_events(events)
+            self._update_gauges()
+            self._check_thresholds()
+
+    def _run_rescan(self):
+        while not self._stop.wait(self.rescan_interval):
+            if self.use_inotify:
+                # The watch limit may have been raised or freed up since. If
+                # not, this scan finishes unwatched and is the interval's rescan
+                self._start_inotify()
+            self._full_scan("periodic")
+            self._update_gauges()
+            self._check_thresholds()
+            if self.mode == MODE_INOTIFY:
+                return
+
+    def run(self):
+        """Scan, then keep totals current until stop() is called"""
+        if self.mode is None:
+            self.initial_scan()
+        while not self._stop.is_set():
+            if self.mode == MODE_INOTIFY:
+                self._run_inotify()
+            else:
+                self._run_rescan()
+        self._close_inotify()
+
+    def start(self):
+        """Run the monitor in a background thread once the initial scan is done"""
+        self.initial_scan()
+        self._thread = threading.Thread(target=self.run, name="file-size-monitor", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the monitor and the query server"""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # Query API and thresholds
+    # ------------------------------------------------------------------
+
+    def get_total(self, path=None):
+        """
+        Current recursive total for a directory.
+
+        Returns:
+            Dict with path, size, files and formatted size, or None if the
+            directory is not under the monitored root
+        """
+        path = os.path.abspath(path) if path else self.root
+        with self._lock:
+            totals = self._tree.totals.get(path)
+            if totals is None:
+                return None
+            size, count = totals
+        return {"path": path, "size": size, "files": count, "formatted": format_file_size(size)}
+
+    def get_totals(self, max_depth=1):
+        """Totals for the root and every directory up to max_depth below it"""
+        root_depth = self.root.count(os.sep)
+        with self._lock:
+            items = [(path, size, count) for path, (size, count) in self._tree.totals.items()
+                     if path.count(os.sep) - root_depth <= max_depth or path == self.root]
+        items.sort(key=lambda item: item[1], reverse=True)
+        return [{"path": path, "size": size, "files": count, "formatted": format_file_size(size)}
+                for path, size, count in items]
+
+    def status(self):
+        """Monitor mode, watch count and time of the last full scan"""
+        with self._lock:
+            watches = len(self._path_to_wd)
+        return {"root": self.root, "mode": self.mode, "watches": watches, "last_scan": self.last_scan}
+
+    def add_threshold(self, limit_bytes, callback, path=None):
+        """
+        Call callback(total, limit_bytes) when a directory grows past limit_bytes.
+
+        The callback fires once per crossing and re-arms after the total
+        drops back below the limit. The directory may not exist yet, but it
+        has to be under the monitored root or it could never fire.
+
+        Raises:
+            ValueError: path is outside the monitored root
+        """
+        path = os.path.abspath(path) if path else self.root
+        if os.path.commonpath([path, self.root]) != self.root:
+            raise ValueError(f"{path} is not under the monitored root {self.root}")
+        with self._lock:
+            self._thresholds.append({"path": path, "limit": limit_bytes, "callback": callback, "fired": False})
+
+    def _check_thresholds(self):
+        triggered = []
+        with self._lock:
+            for threshold in self._thresholds:
+                totals = self._tree.totals.get(threshold["path"])
+                size = totals[0] if totals else 0
+                if size >= threshold["limit"] and not threshold["fired"]:
+                    threshold["fired"] = True
+                    triggered.append(threshold)
+                elif size < threshold["limit"]:
+                    threshold["fired"] = False
+
+        for threshold in triggered:
+            metrics.inc("file_size_monitor_threshold_alerts_total")
+            try:
+                threshold["callback"](self.get_total(threshold["path"]), threshold["limit"])
+            except Exception as e:
+                # A broken callback must not take the monitor thread down
+                metrics.inc("file_size_monitor_callback_errors_total")
+                print(f"Threshold callback failed for {threshold['path']}: {e}")
+
+    def _update_gauges(self):
+        status = self.status()
+        total = self.get_total()
+        metrics.set_gauge("file_size_monitor_watches", status["watches"])
+        metrics.set_gauge("file_size_monitor_inotify", 1 if status["mode"] == MODE_INOTIFY else 0)
+        if total is not None:
+            metrics.set_gauge("file_size_monitor_bytes", total["size"], {"path": self.root})
+            metrics.set_gauge("file_size_monitor_files", total["files"], {"path": self.root})
+
+    def serve(self, port=8765, host="127.0.0.1"):
+        """
+        Serve totals over HTTP on a background thread.
+
+        Endpoints:
+            /total?path=DIR     recursive total for one directory
+            /totals?depth=N     totals down to N levels below the root
+            /status             monitor mode and watch count
+            /metrics            Prometheus text format from utility.metrics
+        """
+        monitor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                if url.path == "/metrics":
+                    self._send(200, metrics.to_prometheus(), "text/plain; version=0.0.4")
+                    return
+                if url.path == "/total":
+                    body = monitor.get_total(query.get("path", [None])[0])
+                elif url.path == "/totals":
+                    try:
+                        depth = int(query.get("depth", ["1"])[0])
+                    except ValueError:
+                        self._send(400, json.dumps({"error": "depth must be an integer"}), "application/json")
+                        return
+                    body = monitor.get_totals(depth)
+                elif url.path == "/status":
+                    body = monitor.status()
+                else:
+                    body = None
+                if body is None:
+                    self._send(404, json.dumps({"error": "not found"}), "application/json")
+                else:
+                    self._send(200, json.dumps(body), "application/json")
+
+            def _send(self, code, text, content_type):
+                payload = text.encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="file-size-monitor-http", daemon=True).start()
+        print(f"Serving totals on http://{host}:{self._server.server_port}/")
+        return self._server.server_port
+
+
+def parse_size(text):
+    """Parse sizes like '1024', '500MB' or '1.5 TB' into bytes"""
+    units = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4}
+    text = text.strip().upper().replace(" ", "")
+    for unit in sorted(units, key=len, reverse=True):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * units[unit])
+    return int(text)
+
+
+def parse_threshold(text):
+    """argparse type for --threshold: SIZE or DIR=SIZE, as (directory or None, bytes)"""
+    directory, _, size = text.rpartition("=")
+    try:
+        return directory or None, parse_size(size)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size {size!r}; use e.g. 1024, 500MB or 1.5TB")
+
+
+# Example usage
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monitor directory sizes with inotify")
+    parser.add_argument("path", help="directory to monitor")
+    parser.add_argument("--threshold", action="append", default=[], type=parse_threshold,
+                        help="alert size for the root, or DIR=SIZE for a subdirectory (repeatable)")
+    parser.add_argument("--port", type=int, default=8765, help="local query port (0 to disable)")
+    parser.add_argument("--rescan-interval", type=int, default=300,
+                        help="seconds between rescans when inotify can't be used")
+    args = parser.parse_args()
+
+    def alert(total, limit):
+        print(f"⚠️ {total['path']} is {total['formatted']}, over the {format_file_size(limit)} threshold")
+
+    monitor = DirectorySizeMonitor(args.path, rescan_interval=args.rescan_interval)
+    for directory, limit in args.threshold:
+        try:
+            monitor.add_threshold(limit, alert, path=directory)
+        except ValueError as e:
+            parser.error(str(e))
+
+    monitor.start()
+    if args.port:
+        monitor.serve(args.port)
+    try:
+        while True:
+            time.sleep(60)
+            metrics.export_run("file_size_monitor")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        monitor.stop()
+        metrics.export_run("file_size_monitor")
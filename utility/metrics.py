@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+# Shared instrumentation for the toolkit's long-running operations.
+#
+# Code paths record timers, counters and gauges into one process-wide
+# registry, which can be written out as a Prometheus text-format file
+# (for the node_exporter textfile collector) or appended as a JSON line
+# to a structured log. Setting TOOLKIT_METRICS_DIR makes export_run()
+# write both; setting TOOLKIT_PROFILE_DIR makes profile_run() dump a
+# cProfile .prof file per run.
+
+import cProfile
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+METRICS_DIR_ENV = "TOOLKIT_METRICS_DIR"
+PROFILE_DIR_ENV = "TOOLKIT_PROFILE_DIR"
+
+_lock = threading.Lock()
+_counters = {}
+_gauges = {}
+_timers = {}
+
+
+def _key(name, labels):
+    return name, tuple(sorted((labels or {}).items()))
+
+
+def inc(name, value=1, labels=None):
+    """Increase a counter by value"""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def set_gauge(name, value, labels=None):
+    """Set a gauge to its current value (e.g. queue depth)"""
+    key = _key(name, labels)
+    with _lock:
+        _gauges[key] = value
+
+
+def observe(name, seconds, labels=None):
+    """Record one duration sample for a timer"""
+    key = _key(name, labels)
+    with _lock:
+        stats = _timers.get(key)
+        if stats is None:
+            stats = _timers[key] = {"count": 0, "sum": 0.0, "max": 0.0}
+        stats["count"] += 1
+        stats["sum"] += seconds
+        if seconds > stats["max"]:
+            stats["max"] = seconds
+
+
+@contextmanager
+def timer(name, labels=None):
+    """Time the enclosed block and record it under name"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, labels)
+
+
+def record_throughput(name, amount, seconds, unit, labels=None):
+    """
+    Record a transfer of amount units over seconds.
+
+    Adds amount to the <name>_<unit>_total counter and sets the
+    <name>_<unit>_per_second gauge, so both bytes and rows can be tracked.
+    """
+    inc(f"{name}_{unit}_total", amount, labels)
+    if seconds > 0:
+        set_gauge(f"{name}_{unit}_per_second", amount / seconds, labels)
+
+
+def reset():
+    """Drop every recorded metric"""
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _timers.clear()
+
+
+def snapshot():
+    """Return the current metrics as a plain dict"""
+    def flatten(store):
+        return [{"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(store.items())]
+
+    with _lock:
+        return {
+            "counters": flatten(_counters),
+            "gauges": flatten(_gauges),
+            "timers": flatten({k: dict(v) for k, v in _timers.items()}),
+        }
+
+
+def _sanitize(name):
+    name = re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+    return name if not name[:1].isdigit() else "_" + name
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels) + list((extra or {}).items())
+    if not items:
+        return ""
+    escaped = []
+    for k, v in items:
+        v = str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        escaped.append(f'{_sanitize(k)}="{v}"')
+    return "{" + ",".join(escaped) + "}"
+
+
+def to_prometheus():
+    """Render the registry in Prometheus text exposition format"""
+    lines = []
+    seen = set()
+
+    def header(name, kind):
+        if name in seen:
+            return
+        seen.add(name)
+        lines.append(f"# TYPE {name} {kind}")
+
+    with _lock:
+        for (name, labels), value in sorted(_counters.items()):
+            metric = _sanitize(name)
+            header(metric, "counter")
+            lines.append(f"{metric}{_format_labels(labels)} {value}")
+        for (name, labels), value in sorted(_gauges.items()):
+            metric = _sanitize(name)
+            header(metric, "gauge")
+            lines.append(f"{metric}{_format_labels(labels)} {value}")
+        timers = sorted(_timers.items())
+        for (name, labels), stats in timers:
+            metric = _sanitize(name) + "_seconds"
+            header(metric, "summary")
+            lines.append(f"{metric}_count{_format_labels(labels)} {stats['count']}")
+            lines.append(f"{metric}_sum{_format_labels(labels)} {stats['sum']:.6f}")
+        # Each family must be one contiguous group, so the max gauges come last
+        for (name, labels), stats in timers:
+            metric = _sanitize(name) + "_seconds_max"
+            header(metric, "gauge")
+            lines.append(f"{metric}{_format_labels(labels)} {stats['max']:.6f}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(file_path):
+    """
+    Write the registry to a Prometheus .prom file.
+
+    The file is written next to its target and renamed into place so a
+    textfile collector never reads a half-written file.
+    """
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(to_prometheus())
+    os.replace(tmp_path, file_path)
+    return file_path
+
+
+def write_json_log(file_path, run_name, **fields):
+    """Append one JSON line with a snapshot of the registry"""
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "run": run_name,
+        "pid": os.getpid(),
+    }
+    record.update(fields)
+    record["metrics"] = snapshot()
+    with open(file_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, default=str) + "\n")
+    return file_path
+
+
+def export_run(run_name, directory=None):
+    """
+    Export both formats for a finished run.
+
+    Writes <run_name>.prom and appends to <run_name>.jsonl in directory,
+    or in $TOOLKIT_METRICS_DIR when directory is None. Does nothing if
+    neither is set.
+    """
+    directory = directory or os.environ.get(METRICS_DIR_ENV)
+    if not directory:
+        return None
+
+    os.makedirs(directory, exist_ok=True)
+    safe_name = _sanitize(run_name)
+    write_prometheus(os.path.join(directory, f"{safe_name}.prom"))
+    write_json_log(os.path.join(directory, f"{safe_name}.jsonl"), run_name)
+    return directory
+
+
+@contextmanager
+def profile_run(run_name, directory=None):
+    """
+    Profile the enclosed block with cProfile.
+
+    Dumps <run_name>_<timestamp>.prof into directory, or into
+    $TOOLKIT_PROFILE_DIR when directory is None. Without either the block
+    runs unprofiled. Inspect dumps with `python -m pstats <file>`.
+    """
+    directory = directory or os.environ.get(PROFILE_DIR_ENV)
+    if not directory:
+        yield None
+        return
+
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    dump_path = os.path.join(directory, f"{_sanitize(run_name)}_{stamp}.prof")
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield dump_path
+    finally:
+        profiler.disable()
+        profiler.dump_stats(dump_path)